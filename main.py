@@ -12,6 +12,7 @@ import asyncpg
 import json
 import os
 import logging
+import zlib
 from contextlib import asynccontextmanager
 import uvicorn
 from pathlib import Path
@@ -193,6 +194,68 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# Inflate gzip-encoded request bodies before they hit the JSON parser.
+# Tablets on slow uplinks submit metrics with Content-Encoding: gzip;
+# Starlette's GZipMiddleware only compresses responses, so inbound
+# bodies need handling here
+MAX_INFLATED_BODY = 10 * 1024 * 1024  # 10MB cap against decompression bombs
+
+class GZipRequestMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            headers = dict(scope["headers"])
+            if headers.get(b"content-encoding", b"").lower() == b"gzip":
+                chunks = []
+                while True:
+                    message = await receive()
+                    chunks.append(message.get("body", b""))
+                    if not message.get("more_body", False):
+                        break
+                try:
+                    # wbits=31 selects gzip framing; max_length bounds how
+                    # much attacker-controlled input can inflate in memory
+                    inflater = zlib.decompressobj(wbits=31)
+                    body = inflater.decompress(
+                        b"".join(chunks), MAX_INFLATED_BODY + 1
+                    )
+                except zlib.error:
+                    response = JSONResponse(
+                        status_code=400,
+                        content={"detail": "Malformed gzip request body"}
+                    )
+                    await response(scope, receive, send)
+                    return
+                if len(body) > MAX_INFLATED_BODY:
+                    response = JSONResponse(
+                        status_code=413,
+                        content={"detail": "Decompressed request body too large"}
+                    )
+                    await response(scope, receive, send)
+                    return
+                new_headers = [
+                    (name, value) for name, value in scope["headers"]
+                    if name not in (b"content-encoding", b"content-length")
+                ]
+                new_headers.append((b"content-length", str(len(body)).encode()))
+                scope = dict(scope, headers=new_headers)
+                consumed = False
+
+                async def inflated_receive():
+                    nonlocal consumed
+                    if consumed:
+                        return {"type": "http.disconnect"}
+                    consumed = True
+                    return {"type": "http.request", "body": body, "more_body": False}
+
+                await self.app(scope, inflated_receive, send)
+                return
+        await self.app(scope, receive, send)
+
+app.add_middleware(GZipRequestMiddleware)
+
 # CORS configuration for Grafana and frontend access
 app.add_middleware(
     CORSMiddleware,
@@ -1214,11 +1277,41 @@ async def get_analytics(token: str = Depends(verify_token)):
 async def get_session_issues(
     device_id: Optional[str] = None,
     hours: int = 24,
+    summary: bool = False,
     token: str = Depends(verify_token)
 ):
     """Advanced session timeout and connectivity analysis"""
     try:
         async with db_pool.acquire() as conn:
+            if summary:
+                # Lightweight aggregate mode - dashboards that only need the
+                # headline counters get four scalars instead of the full
+                # per-device analysis payload
+                summary_params = [str(hours)]
+                summary_where = "WHERE se.timestamp >= NOW() - ($1 || ' hours')::interval"
+                if device_id:
+                    summary_where += " AND se.device_id = $2"
+                    summary_params.append(device_id)
+                
+                summary_row = await conn.fetchrow(f"""
+                    SELECT 
+                        COUNT(*) FILTER (WHERE se.event_type = 'timeout') as total_timeouts,
+                        COUNT(*) FILTER (WHERE se.event_type IN ('login', 'session_start')) as total_logins,
+                        COUNT(*) FILTER (WHERE se.event_type = 'error') as total_errors,
+                        AVG(se.duration) as avg_duration
+                    FROM session_events se
+                    {summary_where}
+                """, *summary_params)
+                
+                return {
+                    "total_timeouts": summary_row["total_timeouts"] or 0,
+                    "total_logins": summary_row["total_logins"] or 0,
+                    "total_errors": summary_row["total_errors"] or 0,
+                    "avg_duration": float(summary_row["avg_duration"] or 0),
+                    "analysis_period_hours": hours,
+                    "generated_at": datetime.now(timezone.utc).isoformat()
+                }
+            
             # Build base query for device registry and related tables
             params = [str(hours)]
             where_clause = "WHERE dm.timestamp >= NOW() - ($1 || ' hours')::interval"
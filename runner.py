@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+🏃 COMBINED DASHBOARD TEST RUNNER
+Runs the full enterprise analysis and the final verification on one shared
+Chromium, so the combined run pays the driver and browser launch cost once
+"""
+
+import asyncio
+import os
+
+import orjson
+
+from test_enterprise_dashboard import (
+    LAUNCH_ARGS,
+    EnterpriseDashboardTester,
+    get_playwright,
+    stop_playwright,
+)
+from test_enterprise_final import FinalTester
+
+
+async def main():
+    p = await get_playwright()
+    browser = await p.chromium.launch(
+        headless=not os.environ.get("HEADED"),
+        args=LAUNCH_ARGS,
+    )
+    try:
+        analysis = await EnterpriseDashboardTester().run_full_analysis(browser)
+        with open("enterprise_dashboard_analysis.json", "wb") as f:
+            f.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
+
+        final = await FinalTester().run_final_test(browser)
+        with open("final_dashboard_test.json", "wb") as f:
+            f.write(orjson.dumps(final, option=orjson.OPT_INDENT_2))
+
+        print("\n💾 Reports saved: enterprise_dashboard_analysis.json, final_dashboard_test.json")
+    finally:
+        await browser.close()
+        await stop_playwright()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
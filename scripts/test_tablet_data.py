@@ -11,14 +11,15 @@ from datetime import datetime, timezone
 API_URL = "https://jd-engineering-monitoring-api-production-5d93.up.railway.app/tablet-metrics"
 API_TOKEN = "ArFetiWcHH5bIbiiwuQupQalDJocJA436YMi00tCvmHZOI82Awp8qbceO681"
 
-# Simulate test tablet data
+# Simulate test tablet data - one timestamp shared by every "now" field
+now = datetime.now(timezone.utc).isoformat()
 payload = {
     "device_id": "test_tablet_001",
     "device_name": "Test Tablet - test_tablet_001",
     "location": "Testing Environment",
     "android_version": "Android 15 (Test)",
     "app_version": "test_monitor_1.0",
-    "timestamp": datetime.now(timezone.utc).isoformat(),
+    "timestamp": now,
     "device_metrics": {
         "battery_level": 85,
         "battery_temperature": 28.5,
@@ -34,7 +35,7 @@ payload = {
     "app_metrics": {
         "screen_state": "active",
         "app_foreground": "teamviewer",
-        "last_user_interaction": datetime.now(timezone.utc).isoformat(),
+        "last_user_interaction": now,
         "teamviewer_active": True,
         "android_settings_active": False,
         "test_environment": True,
@@ -47,7 +48,7 @@ payload = {
         {
             "event_type": "session_start",
             "session_id": "test_session_001",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now,
             "error_message": "TeamViewer test session detected"
         }
     ],
@@ -64,12 +65,12 @@ print("📱 Sending test tablet data...")
 print(f"🆔 Device ID: {payload['device_id']}")
 print(f"📍 Location: {payload['location']}")
 
-headers = {
-    "Authorization": f"Bearer {API_TOKEN}",
-    "Content-Type": "application/json"
-}
+# Authorization lives on the session; requests sets the JSON content-type
+# itself when using json=
+session = requests.Session()
+session.headers["Authorization"] = f"Bearer {API_TOKEN}"
 
-response = requests.post(API_URL, headers=headers, json=payload, timeout=30)
+response = session.post(API_URL, json=payload, timeout=30)
 
 print(f"\n📊 Response Status: {response.status_code}")
 print(f"📝 Response: {response.text}")
@@ -79,9 +80,8 @@ if response.status_code == 200:
     
     # Now check if device appears in list
     print("\n🔍 Checking devices list...")
-    devices_response = requests.get(
-        "https://jd-engineering-monitoring-api-production-5d93.up.railway.app/devices",
-        headers={"Authorization": f"Bearer {API_TOKEN}"}
+    devices_response = session.get(
+        "https://jd-engineering-monitoring-api-production-5d93.up.railway.app/devices"
     )
     
     if devices_response.status_code == 200:
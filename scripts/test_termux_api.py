@@ -5,10 +5,15 @@ Tests all required Termux:API functions before deploying full monitoring
 """
 
 import json
+import re
 import subprocess
 import time
 from datetime import datetime
 
+# Matches Android-ish process lines in one case-insensitive pass, avoiding a
+# .lower() allocation plus three substring scans per line
+ANDROID_PROCESS_PATTERN = re.compile(r'android|system|com\.', re.IGNORECASE)
+
 def test_termux_command(command, description):
     """Test a Termux API command and return results"""
     print(f"\n🧪 Testing: {description}")
@@ -135,8 +140,8 @@ def main():
             print(f"✅ Process monitoring working: {len(processes)} processes found")
             
             # Look for common Android processes
-            android_processes = [p for p in processes if any(x in p.lower() for x in ['android', 'system', 'com.'])]
-            print(f"Android processes detected: {len(android_processes)}")
+            android_processes = sum(1 for p in processes if ANDROID_PROCESS_PATTERN.search(p))
+            print(f"Android processes detected: {android_processes}")
             
         else:
             print("❌ Process monitoring failed")
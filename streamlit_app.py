@@ -1,11 +1,17 @@
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
 import requests
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta, timezone
+import numpy as np
+from datetime import datetime
+import hashlib
+import json
+import orjson
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Page configuration
 st.set_page_config(
@@ -49,19 +55,74 @@ if os.getenv("RAILWAY_ENVIRONMENT"):
 
 headers = {"Authorization": f"Bearer {API_TOKEN}"}
 
+# Pooled keep-alive session - every fetch reuses warm TCP+TLS connections to
+# the same Railway host instead of handshaking per request, and transient
+# Railway 5xx blips are retried with backoff instead of surfacing as errors
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False
+)
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+SESSION.mount("https://", HTTPAdapter(max_retries=RETRY, pool_connections=10, pool_maxsize=10))
+
 # Helper functions
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_cached(endpoint, token):
+    """Fetch one API endpoint, cached on endpoint+token so repeat calls
+    within the TTL reuse the parsed JSON instead of re-downloading it"""
+    response = SESSION.get(f"{API_BASE_URL}{endpoint}", timeout=10)
+    if response.status_code == 200:
+        # orjson decodes the big metrics arrays 2-5x faster than the stdlib
+        # parser behind response.json()
+        return orjson.loads(response.content), None
+    return None, f"API Error: {response.status_code}"
+
 def fetch_data(endpoint):
-    """Fetch data from API endpoint"""
+    """Fetch data from API endpoint (served from the cache when fresh).
+    Returns (data, error) so callers decide where and whether to surface
+    the error, instead of this helper stacking st.error banners mid-rerun"""
     try:
-        response = requests.get(f"{API_BASE_URL}{endpoint}", headers=headers, timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"API Error: {response.status_code}")
-            return None
+        return _fetch_cached(endpoint, API_TOKEN)
     except Exception as e:
-        st.error(f"Connection Error: {str(e)}")
-        return None
+        return None, f"Connection Error: {str(e)}"
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_many(endpoints, token):
+    """Fetch independent endpoints concurrently so wall time is ~1 RTT
+    instead of one round trip per endpoint"""
+    results = {}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {
+            pool.submit(SESSION.get, f"{API_BASE_URL}{endpoint}", timeout=10): endpoint
+            for endpoint in endpoints
+        }
+        for future in as_completed(futures):
+            endpoint = futures[future]
+            try:
+                response = future.result()
+                if response.status_code == 200:
+                    # Cheap content fingerprint so callers can tell whether
+                    # anything actually changed since the previous rerun
+                    digest = hashlib.blake2b(response.content, digest_size=8).hexdigest()
+                    results[endpoint] = (orjson.loads(response.content), digest)
+                else:
+                    results[endpoint] = (None, None)
+            except Exception:
+                results[endpoint] = (None, None)
+    return results
+
+def unpack_if_changed(results, endpoint):
+    """Unpack a fetch_many entry and report whether its content hash moved
+    since the last rerun - unchanged data lets tabs reuse cached figures"""
+    data, digest = results.get(endpoint, (None, None))
+    state_key = f"hash_{endpoint}"
+    changed = digest is None or st.session_state.get(state_key) != digest
+    st.session_state[state_key] = digest
+    return data, changed
 
 def get_status_color(status):
     """Get color based on device status"""
@@ -72,33 +133,81 @@ def get_status_color(status):
     }
     return colors.get(status, "#6c757d")
 
-def format_time_ago(timestamp):
-    """Format timestamp as time ago"""
-    if not timestamp:
-        return "Never"
-    
+def format_time_ago_series(s):
+    """Format timestamps as relative times - one C-level pass over the
+    whole column instead of a Python call per row"""
+    dt = pd.to_datetime(s, utc=True, errors="coerce")
+    delta = (pd.Timestamp.now(tz="UTC") - dt).dt.total_seconds()
+    formatted = np.select(
+        [delta < 60, delta < 3600, delta < 86400],
+        [
+            delta.fillna(0).astype(int).astype(str) + "s ago",
+            (delta.fillna(0) // 60).astype(int).astype(str) + "m ago",
+            (delta.fillna(0) // 3600).astype(int).astype(str) + "h ago"
+        ],
+        default=(delta.fillna(0) // 86400).astype(int).astype(str) + "d ago"
+    )
+    return pd.Series(formatted, index=s.index).where(dt.notna(), "Never")
+
+@st.cache_resource
+def plotly_modules():
+    """Import Plotly lazily, once per server process - keeps the ~400ms
+    import off the container cold-start path until a chart is built"""
+    import plotly.express as px
+    return px
+
+def lttb(df, x, y, n=500):
+    """Downsample a time series to ~n visually representative points with
+    MinMax-LTTB - a ~600px-wide chart can't show thousands of raw rows, so
+    shipping them to the browser is pure Plotly JSON bloat"""
+    if len(df) <= n:
+        return df
     try:
-        if isinstance(timestamp, str):
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        else:
-            dt = timestamp
-            
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-            
-        now = datetime.now(timezone.utc)
-        diff = now - dt
-        
-        if diff.total_seconds() < 60:
-            return f"{int(diff.total_seconds())}s ago"
-        elif diff.total_seconds() < 3600:
-            return f"{int(diff.total_seconds() / 60)}m ago"
-        elif diff.total_seconds() < 86400:
-            return f"{int(diff.total_seconds() / 3600)}h ago"
-        else:
-            return f"{int(diff.total_seconds() / 86400)}d ago"
-    except:
-        return "Unknown"
+        from tsdownsample import MinMaxLTTBDownsampler
+    except ImportError:
+        return df
+    idx = MinMaxLTTBDownsampler().downsample(
+        pd.to_datetime(df[x], utc=True, errors="coerce").values.astype("datetime64[ns]").astype("int64"),
+        df[y].values.astype("float64"),
+        n_out=n
+    )
+    return df.iloc[idx]
+
+# DataFrame-aware hashing for cached figure builders - identical frame
+# content yields a cache hit instead of rebuilding + re-serializing the trace
+DF_HASH = {pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=True).values.tobytes()}
+
+@st.cache_data(ttl=30, show_spinner=False, hash_funcs=DF_HASH)
+def build_line_fig(df, x, y, title, labels, y_range=None):
+    """Build (or reuse) a cached line figure for one metric column"""
+    px = plotly_modules()
+    fig = px.line(lttb(df, x, y), x=x, y=y, title=title, labels=labels)
+    if y_range:
+        fig.update_layout(yaxis_range=y_range)
+    return fig
+
+@st.cache_data(ttl=30, show_spinner=False, hash_funcs=DF_HASH)
+def build_connectivity_fig(network_df):
+    """Build (or reuse) the cached connectivity-status pie"""
+    px = plotly_modules()
+    status_counts = network_df['connectivity_status'].value_counts()
+    return px.pie(
+        values=status_counts.values,
+        names=status_counts.index,
+        title='Connectivity Status Distribution'
+    )
+
+@st.cache_data(ttl=30, max_entries=32, show_spinner=False)
+def get_device_metrics(device_id, hours):
+    """Per-device metrics, LRU-cached on (device_id, hours) so flipping back
+    to a recently viewed device doesn't re-download its whole time series"""
+    return fetch_data(f"/devices/{device_id}/metrics?hours={hours}")
+
+@st.cache_data(ttl=30, show_spinner=False)
+def to_metrics_frames(payload):
+    """Cache the DataFrame builds alongside the JSON they came from"""
+    return (pd.DataFrame(payload.get('device_metrics', [])),
+            pd.DataFrame(payload.get('network_metrics', [])))
 
 # Sidebar
 with st.sidebar:
@@ -117,18 +226,28 @@ with st.sidebar:
         index=3
     )
     
-    # Manual refresh button
+    # Manual refresh button - clears the fetch cache so we don't just
+    # re-render the same cached responses
     if st.button("🔄 Refresh Now", use_container_width=True):
+        _fetch_cached.clear()
+        fetch_many.clear()
         st.rerun()
     
     # API Status
     st.subheader("🔌 API Status")
-    health = fetch_data("/health")
+    health, health_err = fetch_data("/health")
     if health:
         st.success("✅ API Connected")
         st.caption(f"Environment: {health.get('environment', 'unknown')}")
     else:
         st.error("❌ API Disconnected")
+        if health_err:
+            st.caption(health_err)
+
+# Non-blocking auto-refresh - a browser-side timer triggers the rerun, so the
+# server thread stays free to answer widget interactions immediately
+if auto_refresh:
+    st_autorefresh(interval=refresh_interval * 1000, key="data_refresh")
 
 # Main content
 st.title("📱 JD Engineering Tablet Monitoring Dashboard")
@@ -137,10 +256,29 @@ st.markdown("Real-time monitoring of tablet devices in engineering environments"
 # Tabs for different views
 tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "📱 Device Details", "📈 Analytics", "🔍 Session Issues"])
 
+# Shared fetches - the always-rendered tiles only need /devices plus the
+# lightweight server-side summary; the heavy per-device analysis payload is
+# downloaded lazily where it's actually viewed
+session_endpoint = f"/analytics/session-issues?hours={time_range}"
+summary_endpoint = f"{session_endpoint}&summary=true"
+
+# Debounce guard - while the user is still scrubbing a control (reruns less
+# than 300ms apart), render the previous data and skip the fetch; only the
+# settled value triggers real requests
+now_mono = time.monotonic()
+last_interaction = st.session_state.get("last_interaction", 0.0)
+st.session_state["last_interaction"] = now_mono
+
+if now_mono - last_interaction < 0.3 and "last_prefetch" in st.session_state:
+    devices, session_summary = st.session_state["last_prefetch"]
+    devices_changed = False
+else:
+    prefetched = fetch_many(("/devices", summary_endpoint), API_TOKEN)
+    devices, devices_changed = unpack_if_changed(prefetched, "/devices")
+    session_summary, _ = unpack_if_changed(prefetched, summary_endpoint)
+    st.session_state["last_prefetch"] = (devices, session_summary)
+
 with tab1:
-    # Fetch devices data
-    devices = fetch_data("/devices")
-    
     if devices:
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -165,56 +303,71 @@ with tab1:
         col1, col2 = st.columns([2, 3])
         
         with col1:
-            # Pie chart
-            status_counts = pd.DataFrame([
-                {"Status": "Online", "Count": online_devices, "Color": "#28a745"},
-                {"Status": "Recent", "Count": recent_devices, "Color": "#ffc107"},
-                {"Status": "Offline", "Count": offline_devices, "Color": "#dc3545"}
-            ])
-            
-            fig_pie = px.pie(
-                status_counts, 
-                values='Count', 
-                names='Status',
-                color='Status',
-                color_discrete_map={'Online': '#28a745', 'Recent': '#ffc107', 'Offline': '#dc3545'}
-            )
-            fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig_pie, use_container_width=True)
+            # Pie chart - rebuilt only when /devices actually changed,
+            # otherwise the previous figure is re-emitted from session state
+            if devices_changed or "fig_pie" not in st.session_state:
+                px = plotly_modules()
+                status_counts = pd.DataFrame([
+                    {"Status": "Online", "Count": online_devices, "Color": "#28a745"},
+                    {"Status": "Recent", "Count": recent_devices, "Color": "#ffc107"},
+                    {"Status": "Offline", "Count": offline_devices, "Color": "#dc3545"}
+                ])
+                
+                fig_pie = px.pie(
+                    status_counts, 
+                    values='Count', 
+                    names='Status',
+                    color='Status',
+                    color_discrete_map={'Online': '#28a745', 'Recent': '#ffc107', 'Offline': '#dc3545'}
+                )
+                fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+                st.session_state["fig_pie"] = fig_pie
+            st.plotly_chart(st.session_state["fig_pie"], use_container_width=True)
         
         with col2:
             # Device table
             st.subheader("📋 Device List")
             
-            # Prepare data for table
-            device_data = []
-            for device in devices:
-                status_html = f"<span class='{device['status']}-status'>{device['status'].upper()}</span>"
-                device_data.append({
-                    "Device ID": device['device_id'],
-                    "Name": device.get('device_name', 'Unknown'),
-                    "Location": device.get('location', 'Unknown'),
-                    "Status": status_html,
-                    "Last Seen": format_time_ago(device.get('last_seen')),
-                    "Sessions": device.get('total_sessions', 0),
-                    "Timeouts": device.get('total_timeouts', 0)
-                })
-            
-            df = pd.DataFrame(device_data)
-            st.write(df.to_html(escape=False, index=False), unsafe_allow_html=True)
+            # Arrow-backed virtualized table - only visible rows hit the DOM,
+            # updates are diffed, and relative times are precomputed in one
+            # vectorized pass over the column
+            df = pd.json_normalize(devices).reindex(
+                columns=["device_id", "device_name", "location", "status",
+                         "last_seen", "total_sessions", "total_timeouts"]
+            )
+            df["device_name"] = df["device_name"].fillna("Unknown")
+            df["location"] = df["location"].fillna("Unknown")
+            df[["total_sessions", "total_timeouts"]] = df[["total_sessions", "total_timeouts"]].fillna(0)
+            df["status"] = df["status"].str.upper()
+            df["last_seen"] = format_time_ago_series(df["last_seen"])
+            st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "device_id": st.column_config.TextColumn("Device ID"),
+                    "device_name": st.column_config.TextColumn("Name"),
+                    "location": st.column_config.TextColumn("Location"),
+                    "status": st.column_config.TextColumn("Status"),
+                    "last_seen": st.column_config.TextColumn("Last Seen"),
+                    "total_sessions": st.column_config.NumberColumn("Sessions"),
+                    "total_timeouts": st.column_config.NumberColumn("Timeouts")
+                }
+            )
 
 with tab2:
     st.subheader("📱 Device Metrics Dashboard")
     
-    # Device selector
-    devices = fetch_data("/devices")
+    # Device selector (reuses the shared /devices fetch)
     if devices:
         device_ids = [d['device_id'] for d in devices]
         selected_device = st.selectbox("Select Device", device_ids)
         
         if selected_device:
-            # Fetch device metrics
-            metrics = fetch_data(f"/devices/{selected_device}/metrics?hours={time_range}")
+            # Fetch device metrics (memoized per device + time range)
+            metrics, metrics_err = get_device_metrics(selected_device, time_range)
+            if metrics_err:
+                st.toast(metrics_err, icon="⚠️")
             
             if metrics:
                 # Device info
@@ -229,128 +382,136 @@ with tab2:
                     status = device_info.get('status', 'unknown')
                     st.info(f"**Status:** {status.upper()}")
                 
+                battery_data, network_data = to_metrics_frames(metrics)
+                
                 # Metrics charts
-                if metrics.get('device_metrics'):
+                if not battery_data.empty:
                     st.subheader("🔋 Device Performance")
-                    
-                    # Battery level chart
-                    battery_data = pd.DataFrame(metrics['device_metrics'])
                     if 'battery_level' in battery_data.columns:
-                        fig_battery = px.line(
-                            battery_data, 
-                            x='timestamp', 
-                            y='battery_level',
-                            title='Battery Level Over Time',
-                            labels={'battery_level': 'Battery %', 'timestamp': 'Time'}
+                        fig_battery = build_line_fig(
+                            battery_data,
+                            'timestamp',
+                            'battery_level',
+                            'Battery Level Over Time',
+                            {'battery_level': 'Battery %', 'timestamp': 'Time'},
+                            y_range=[0, 100]
                         )
-                        fig_battery.update_layout(yaxis_range=[0, 100])
                         st.plotly_chart(fig_battery, use_container_width=True)
                     
                     # CPU usage chart
                     if 'cpu_usage' in battery_data.columns:
-                        fig_cpu = px.line(
+                        fig_cpu = build_line_fig(
                             battery_data,
-                            x='timestamp',
-                            y='cpu_usage',
-                            title='CPU Usage Over Time',
-                            labels={'cpu_usage': 'CPU %', 'timestamp': 'Time'}
+                            'timestamp',
+                            'cpu_usage',
+                            'CPU Usage Over Time',
+                            {'cpu_usage': 'CPU %', 'timestamp': 'Time'},
+                            y_range=[0, 100]
                         )
-                        fig_cpu.update_layout(yaxis_range=[0, 100])
                         st.plotly_chart(fig_cpu, use_container_width=True)
                 
                 # Network metrics
-                if metrics.get('network_metrics'):
+                if not network_data.empty:
                     st.subheader("📡 Network Status")
                     
-                    network_data = pd.DataFrame(metrics['network_metrics'])
-                    
                     col1, col2 = st.columns(2)
                     
                     with col1:
                         # WiFi signal strength
                         if 'wifi_signal_strength' in network_data.columns:
-                            fig_wifi = px.line(
+                            fig_wifi = build_line_fig(
                                 network_data,
-                                x='timestamp',
-                                y='wifi_signal_strength',
-                                title='WiFi Signal Strength',
-                                labels={'wifi_signal_strength': 'Signal (dBm)', 'timestamp': 'Time'}
+                                'timestamp',
+                                'wifi_signal_strength',
+                                'WiFi Signal Strength',
+                                {'wifi_signal_strength': 'Signal (dBm)', 'timestamp': 'Time'}
                             )
                             st.plotly_chart(fig_wifi, use_container_width=True)
                     
                     with col2:
                         # Connectivity status
                         if 'connectivity_status' in network_data.columns:
-                            status_counts = network_data['connectivity_status'].value_counts()
-                            fig_conn = px.pie(
-                                values=status_counts.values,
-                                names=status_counts.index,
-                                title='Connectivity Status Distribution'
-                            )
+                            fig_conn = build_connectivity_fig(network_data)
                             st.plotly_chart(fig_conn, use_container_width=True)
 
 with tab3:
     st.subheader("📈 Session Analytics")
     
-    # Fetch session analytics
-    analytics = fetch_data(f"/analytics/session-issues?hours={time_range}")
-    
-    if analytics and analytics.get('session_analysis'):
-        session_df = pd.DataFrame(analytics['session_analysis'])
-        
-        # Top metrics
+    if session_summary:
+        # Top metrics come straight from the server-side aggregate - four
+        # scalars over the wire instead of the full per-device frame
         col1, col2, col3, col4 = st.columns(4)
         
-        total_timeouts = session_df['timeout_count'].sum() if 'timeout_count' in session_df else 0
-        total_logins = session_df['login_count'].sum() if 'login_count' in session_df else 0
-        total_errors = session_df['error_count'].sum() if 'error_count' in session_df else 0
-        avg_duration = session_df['avg_session_duration'].mean() if 'avg_session_duration' in session_df else 0
-        
         with col1:
-            st.metric("Total Timeouts", int(total_timeouts))
+            st.metric("Total Timeouts", int(session_summary.get('total_timeouts', 0)))
         with col2:
-            st.metric("Total Logins", int(total_logins))
+            st.metric("Total Logins", int(session_summary.get('total_logins', 0)))
         with col3:
-            st.metric("Total Errors", int(total_errors))
+            st.metric("Total Errors", int(session_summary.get('total_errors', 0)))
         with col4:
+            avg_duration = session_summary.get('avg_duration', 0)
             st.metric("Avg Session (min)", f"{int(avg_duration/60)}" if avg_duration else "0")
         
-        # Timeout analysis by device
-        if not session_df.empty:
-            st.subheader("⏱️ Timeout Analysis by Device")
-            
-            fig_timeouts = px.bar(
-                session_df.sort_values('timeout_count', ascending=True).tail(10),
-                x='timeout_count',
-                y='device_id',
-                orientation='h',
-                title='Top 10 Devices by Timeout Count',
-                labels={'timeout_count': 'Number of Timeouts', 'device_id': 'Device'}
-            )
-            st.plotly_chart(fig_timeouts, use_container_width=True)
-            
-            # Session success rate
-            st.subheader("✅ Session Success Rate")
-            
-            session_df['success_rate'] = (session_df['logout_count'] / 
-                                         (session_df['login_count'] + 0.0001) * 100).round(2)
-            
-            fig_success = px.scatter(
-                session_df,
-                x='login_count',
-                y='success_rate',
-                size='timeout_count',
-                hover_data=['device_name', 'location'],
-                title='Session Success Rate vs Login Count',
-                labels={'success_rate': 'Success Rate (%)', 'login_count': 'Number of Logins'}
-            )
-            st.plotly_chart(fig_success, use_container_width=True)
+        # Heavy per-device payload only downloads when the breakdown is open
+        if st.toggle("📊 Per-device breakdown"):
+            analytics, analytics_err = fetch_data(session_endpoint)
+            if analytics_err:
+                st.toast(analytics_err, icon="⚠️")
+            if analytics and analytics.get('session_analysis'):
+                px = plotly_modules()
+                session_df = pd.DataFrame(analytics['session_analysis'])
+                
+                digest = hashlib.blake2b(
+                    json.dumps(analytics, default=str, sort_keys=True).encode(),
+                    digest_size=8
+                ).hexdigest()
+                analytics_changed = st.session_state.get("hash_session_breakdown") != digest
+                st.session_state["hash_session_breakdown"] = digest
+                
+                if not session_df.empty:
+                    st.subheader("⏱️ Timeout Analysis by Device")
+                    
+                    # Figures are only rebuilt (and re-serialized to Plotly JSON) when
+                    # the analytics payload hash moved since the previous rerun
+                    if analytics_changed or "fig_timeouts" not in st.session_state:
+                        fig_timeouts = px.bar(
+                            session_df.sort_values('timeout_count', ascending=True).tail(10),
+                            x='timeout_count',
+                            y='device_id',
+                            orientation='h',
+                            title='Top 10 Devices by Timeout Count',
+                            labels={'timeout_count': 'Number of Timeouts', 'device_id': 'Device'}
+                        )
+                        st.session_state["fig_timeouts"] = fig_timeouts
+                    st.plotly_chart(st.session_state["fig_timeouts"], use_container_width=True)
+                    
+                    # Session success rate
+                    st.subheader("✅ Session Success Rate")
+                    
+                    if analytics_changed or "fig_success" not in st.session_state:
+                        session_df['success_rate'] = (session_df['logout_count'] / 
+                                                     (session_df['login_count'] + 0.0001) * 100).round(2)
+                        
+                        fig_success = px.scatter(
+                            session_df,
+                            x='login_count',
+                            y='success_rate',
+                            size='timeout_count',
+                            hover_data=['device_name', 'location'],
+                            title='Session Success Rate vs Login Count',
+                            labels={'success_rate': 'Success Rate (%)', 'login_count': 'Number of Logins'}
+                        )
+                        st.session_state["fig_success"] = fig_success
+                    st.plotly_chart(st.session_state["fig_success"], use_container_width=True)
 
 with tab4:
     st.subheader("🔍 Session Issues Deep Dive")
     
-    # Fetch detailed analytics
-    analytics = fetch_data(f"/analytics/session-issues?hours={time_range}")
+    # Deep dive needs the full analysis payload (shared with tab3's breakdown
+    # through the fetch cache)
+    analytics, analytics_err = fetch_data(session_endpoint)
+    if analytics_err:
+        st.toast(analytics_err, icon="⚠️")
     
     if analytics:
         col1, col2 = st.columns([2, 1])
@@ -398,11 +559,6 @@ with tab4:
                     if avg_offline > 5:
                         st.warning("⚠️ Frequent disconnections detected")
 
-# Auto-refresh logic
-if auto_refresh:
-    time.sleep(refresh_interval)
-    st.rerun()
-
 # Footer
 st.markdown("---")
 st.caption("🚀 JD Engineering Tablet Monitoring System | Last updated: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S")) 
\ No newline at end of file
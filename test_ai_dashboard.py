@@ -4,8 +4,10 @@ Comprehensive AI Dashboard Test Suite
 Tests all enhanced features to ensure bulletproof operation
 """
 
+import asyncio
+import aiohttp
 import requests
-import json
+import orjson
 import time
 from datetime import datetime
 
@@ -14,45 +16,88 @@ API_BASE = "https://jd-engineering-monitoring-api-production.up.railway.app"
 API_TOKEN = "ArFetiWcHH5bIbiiwuQupQalDJocJA436YMi00tCvmHZOI82Awp8qbceO681"
 HEADERS = {"Authorization": f"Bearer {API_TOKEN}"}
 
-def test_endpoint(name, url, expected_keys=None):
+# Shared session for the remaining blocking calls - keep-alive skips the
+# TCP+TLS handshake on every request after the first
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+
+# (result key, display name, url, expected keys) - the endpoint checks are
+# independent, so they all launch together on one event loop
+ENDPOINT_TESTS = [
+    ("health", "Health Check", f"{API_BASE}/health",
+     ['status', 'timestamp']),
+    ("analytics", "Analytics Data", f"{API_BASE}/analytics",
+     ['total_devices', 'online_devices', 'avg_battery']),
+    ("devices", "Device List", f"{API_BASE}/devices",
+     None),  # List response
+    ("ai_comprehensive", "AI Comprehensive Analysis",
+     f"{API_BASE}/analytics/ai/comprehensive-analysis",
+     ['ai_powered_insights', 'business_intelligence']),
+    ("ai_predictive", "AI Predictive Maintenance",
+     f"{API_BASE}/analytics/ai/predictive-maintenance",
+     ['predictive_maintenance', 'priority_actions']),
+    ("ai_anomaly", "AI Anomaly Detection",
+     f"{API_BASE}/analytics/ai/anomaly-detection",
+     ['anomaly_detection', 'detected_anomalies']),
+    ("ai_forecasting", "AI Business Forecasting",
+     f"{API_BASE}/analytics/ai/business-forecasting",
+     ['business_forecasting', 'productivity_forecast']),
+    ("bi_myob", "MYOB Timeout Analysis",
+     f"{API_BASE}/analytics/business/myob-timeout-analysis",
+     ['business_impact', 'detailed_analysis']),
+    ("bi_insights", "AI Insights", f"{API_BASE}/analytics/ai/insights",
+     ['ai_insights', 'pattern_analysis']),
+]
+
+async def test_endpoint(session, name, url, expected_keys=None):
     """Test an API endpoint and verify response"""
     print(f"\n🧪 Testing {name}...")
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ {name}: SUCCESS (Status: {response.status_code})")
-            
-            if expected_keys:
-                missing_keys = [key for key in expected_keys if key not in data]
-                if missing_keys:
-                    print(f"⚠️  Missing keys: {missing_keys}")
-                else:
-                    print(f"✅ All expected keys present: {expected_keys}")
-            
-            # Show sample data
-            if isinstance(data, dict):
-                sample_keys = list(data.keys())[:5]
-                print(f"📊 Sample keys: {sample_keys}")
-                if 'generated_at' in data:
-                    print(f"🕒 Generated: {data['generated_at']}")
-            
-            return True, data
-        else:
-            print(f"❌ {name}: FAILED (Status: {response.status_code})")
-            print(f"   Response: {response.text[:200]}...")
-            return False, None
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                print(f"✅ {name}: SUCCESS (Status: {response.status})")
+                
+                if expected_keys:
+                    missing_keys = [key for key in expected_keys if key not in data]
+                    if missing_keys:
+                        print(f"⚠️  Missing keys: {missing_keys}")
+                    else:
+                        print(f"✅ All expected keys present: {expected_keys}")
+                
+                # Show sample data
+                if isinstance(data, dict):
+                    sample_keys = list(data.keys())[:5]
+                    print(f"📊 Sample keys: {sample_keys}")
+                    if 'generated_at' in data:
+                        print(f"🕒 Generated: {data['generated_at']}")
+                
+                return True, data
+            else:
+                body = await response.text()
+                print(f"❌ {name}: FAILED (Status: {response.status})")
+                print(f"   Response: {body[:200]}...")
+                return False, None
             
     except Exception as e:
         print(f"❌ {name}: ERROR - {str(e)}")
         return False, None
 
+async def run_endpoint_tests():
+    """Fire every endpoint check concurrently over one connection pool -
+    total wall time is the slowest endpoint, not the sum of all of them"""
+    async with aiohttp.ClientSession(headers=HEADERS) as session:
+        outcomes = await asyncio.gather(
+            *(test_endpoint(session, name, url, keys)
+              for _, name, url, keys in ENDPOINT_TESTS)
+        )
+    return {key: outcome[0] for (key, _, _, _), outcome in zip(ENDPOINT_TESTS, outcomes)}
+
 def test_dashboard_accessibility():
     """Test dashboard HTML accessibility"""
     print(f"\n🌐 Testing Dashboard Accessibility...")
     try:
-        response = requests.get(f"{API_BASE}/dashboard", timeout=10)
+        response = SESSION.get(f"{API_BASE}/dashboard", timeout=10)
         if response.status_code == 200:
             content = response.text
             
@@ -94,71 +139,11 @@ def main():
     # Test results tracking
     results = {}
     
-    # Core API Tests
-    print("\n📡 CORE API ENDPOINTS")
-    print("-" * 30)
-    
-    results['health'] = test_endpoint(
-        "Health Check", 
-        f"{API_BASE}/health",
-        ['status', 'timestamp']
-    )[0]
-    
-    results['analytics'] = test_endpoint(
-        "Analytics Data", 
-        f"{API_BASE}/analytics",
-        ['total_devices', 'online_devices', 'avg_battery']
-    )[0]
-    
-    results['devices'] = test_endpoint(
-        "Device List", 
-        f"{API_BASE}/devices",
-        None  # List response
-    )[0]
-    
-    # AI Enhancement Tests
-    print("\n🤖 AI ENHANCEMENT ENDPOINTS")
+    # Core API + AI + BI endpoint tests, all concurrent
+    print("\n📡 API ENDPOINT TESTS (concurrent)")
     print("-" * 30)
     
-    results['ai_comprehensive'] = test_endpoint(
-        "AI Comprehensive Analysis", 
-        f"{API_BASE}/analytics/ai/comprehensive-analysis",
-        ['ai_powered_insights', 'business_intelligence']
-    )[0]
-    
-    results['ai_predictive'] = test_endpoint(
-        "AI Predictive Maintenance", 
-        f"{API_BASE}/analytics/ai/predictive-maintenance",
-        ['predictive_maintenance', 'priority_actions']
-    )[0]
-    
-    results['ai_anomaly'] = test_endpoint(
-        "AI Anomaly Detection", 
-        f"{API_BASE}/analytics/ai/anomaly-detection",
-        ['anomaly_detection', 'detected_anomalies']
-    )[0]
-    
-    results['ai_forecasting'] = test_endpoint(
-        "AI Business Forecasting", 
-        f"{API_BASE}/analytics/ai/business-forecasting",
-        ['business_forecasting', 'productivity_forecast']
-    )[0]
-    
-    # Business Intelligence Tests
-    print("\n📊 BUSINESS INTELLIGENCE ENDPOINTS")
-    print("-" * 30)
-    
-    results['bi_myob'] = test_endpoint(
-        "MYOB Timeout Analysis", 
-        f"{API_BASE}/analytics/business/myob-timeout-analysis",
-        ['business_impact', 'detailed_analysis']
-    )[0]
-    
-    results['bi_insights'] = test_endpoint(
-        "AI Insights", 
-        f"{API_BASE}/analytics/ai/insights",
-        ['ai_insights', 'pattern_analysis']
-    )[0]
+    results.update(asyncio.run(run_endpoint_tests()))
     
     # Dashboard Accessibility Test
     print("\n🌐 DASHBOARD ACCESSIBILITY")
@@ -169,11 +154,12 @@ def main():
     print("\n⚡ PERFORMANCE TESTS")
     print("-" * 30)
     
+    async def timed_analytics():
+        async with aiohttp.ClientSession(headers=HEADERS) as session:
+            return await test_endpoint(session, "Analytics Performance", f"{API_BASE}/analytics")
+    
     start_time = time.time()
-    analytics_success, analytics_data = test_endpoint(
-        "Analytics Performance", 
-        f"{API_BASE}/analytics"
-    )
+    analytics_success, analytics_data = asyncio.run(timed_analytics())
     end_time = time.time()
     
     response_time = (end_time - start_time) * 1000
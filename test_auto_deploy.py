@@ -5,9 +5,17 @@ Run this to test that deployments trigger automatically on git push
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime
 
+# Module-level session so repeat runs in one process reuse the pooled
+# keep-alive connection to Railway, with a couple of backed-off retries to
+# ride out cold-start blips
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.3)))
+
 def test_auto_deployment():
     """Test that the Railway deployment is working and responding"""
     try:
@@ -16,11 +24,14 @@ def test_auto_deployment():
         print("🔄 Testing Railway auto-deployment...")
         print(f"📍 URL: {url}")
         
-        response = requests.get(url, timeout=10)
-        
+        # One GET covers both the status check and the body we always
+        # print; the split (connect, read) timeout fails fast on
+        # unreachable hosts
+        response = SESSION.get(url, timeout=(3, 10))
+
         if response.status_code == 200:
-            data = response.json()
             print("✅ Deployment successful!")
+            data = response.json()
             print(f"📊 Status: {data.get('status')}")
             print(f"🗄️ Database: {data.get('database')}")
             print(f"🌍 Environment: {data.get('environment')}")
@@ -37,6 +48,8 @@ def test_auto_deployment():
 
 if __name__ == "__main__":
     success = test_auto_deployment()
-    exit(0 if success else 1) # Auto-deploy verification test: Sat Jun 28 08:21:32 NZST 2025
-Auto-deploy test from corrected repository: Sat Jun 28 08:32:20 NZST 2025
-Railway auto-deploy test Sat Jun 28 08:36:39 NZST 2025
+    exit(0 if success else 1)
+
+# Auto-deploy verification test: Sat Jun 28 08:21:32 NZST 2025
+# Auto-deploy test from corrected repository: Sat Jun 28 08:32:20 NZST 2025
+# Railway auto-deploy test Sat Jun 28 08:36:39 NZST 2025
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+🧪 ENTERPRISE DASHBOARD TESTING SUITE
+Comprehensive Playwright analysis of the business intelligence dashboard:
+performance, functionality, UI/UX, accessibility and enterprise features
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from datetime import datetime
+
+import orjson
+
+from playwright.async_api import async_playwright
+
+# Pin the browser cache to a stable location so fresh shells / CI jobs reuse
+# the already-downloaded Chromium instead of re-fetching it (~50s cold)
+os.environ.setdefault("PLAYWRIGHT_BROWSERS_PATH", os.path.expanduser("~/.cache/ms-playwright"))
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://jd-engineering-monitoring-api-production-5d93.up.railway.app"
+
+# Headless Chromium with the renderer/compositor overhead switched off - the
+# checks only look at the DOM, never at pixels. Set HEADED=1 to watch the run.
+LAUNCH_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-extensions",
+]
+
+# The checks read DOM structure, counts and layout visibility - never pixels -
+# so heavyweight resource types are aborted at the context level. JS, CSS and
+# XHR still load, keeping the dashboard logic intact.
+BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+
+
+async def block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+_PW = None
+
+
+async def get_playwright():
+    """Start the Node driver once per process and hand out the same instance.
+    Spawning it costs a few hundred ms, which running both suites used to pay
+    twice; the final verification now reuses this one."""
+    global _PW
+    if _PW is None:
+        _PW = await async_playwright().start()
+    return _PW
+
+
+async def stop_playwright():
+    global _PW
+    if _PW is not None:
+        await _PW.stop()
+        _PW = None
+
+
+class EnterpriseDashboardTester:
+    """Runs the full dashboard analysis against the deployed dashboard"""
+
+    def __init__(self, base_url=BASE_URL):
+        self.base_url = base_url
+        self.results = {
+            "timestamp": datetime.now().isoformat(),
+            "performance": {},
+            "functionality": {},
+            "ui_ux": {},
+            "accessibility": {},
+            "enterprise_features": {},
+        }
+        # (selector, result key) pairs computed once - the phases used to
+        # rebuild these lists and re-sanitize the keys on every invocation
+        self._key_elements = [
+            (s, s.lstrip('.#'))
+            for s in (".business-overview", ".device-grid", ".financial-impact", ".ai-insights")
+        ]
+        self._bi_elements = [
+            (s, s.lstrip('.#'))
+            for s in (".business-overview", ".financial-impact", ".ai-insights")
+        ]
+        # Rendered-DOM snapshot captured by the performance phase and replayed
+        # locally by the static DOM-presence phases
+        self._cached_html = None
+
+    async def run_full_analysis(self, browser=None):
+        print("🚀 Starting Enterprise Dashboard Analysis...")
+        print("=" * 60)
+
+        # Only Chromium is ever exercised, so the old per-browser dispatch
+        # (and the browser-name dict layer it threaded through every result
+        # write) is gone; the phases run directly against one context. An
+        # injected browser (see runner.py) is reused and left open so the
+        # combined run pays the launch cost once.
+        owns_browser = browser is None
+        if owns_browser:
+            p = await get_playwright()
+            browser = await p.chromium.launch(
+                headless=not os.environ.get("HEADED"),
+                args=LAUNCH_ARGS,
+            )
+        context = await browser.new_context()
+        await context.route("**/*", block_heavy_resources)
+
+        async def _run_phase(phase):
+            # Phases never navigate themselves - load the dashboard on a
+            # dedicated page, then hand it over
+            page = await context.new_page()
+            await page.goto(f"{self.base_url}/dashboard")
+            # domcontentloaded is all the DOM checks need; networkidle would
+            # sit out a 500ms quiet window - or hang until the 30s timeout on
+            # a dashboard that keeps polling. Only _test_performance keeps
+            # networkidle, where the full load is the thing being measured.
+            await page.wait_for_load_state("domcontentloaded")
+            await phase(page)
+
+        async def _run_cached_phase(phase):
+            # Static DOM-presence phases replay the snapshot captured by the
+            # performance phase - same HTML, zero server and network cost
+            page = await context.new_page()
+            await page.set_content(self._cached_html, wait_until="domcontentloaded")
+            await phase(page)
+
+        try:
+            # The performance phase runs first on its own fresh page so its
+            # cold-load measurement stays valid; it also captures the DOM
+            # snapshot. The remaining phases are independent read-only
+            # observations and run concurrently on separate pages multiplexed
+            # over the one CDP connection. Functionality and UI/UX still hit
+            # the live server (button clicks and breakpoint layout need it).
+            await self._test_performance(await context.new_page())
+            await asyncio.gather(
+                _run_phase(self._test_functionality),
+                self._test_ui_ux(context),
+                _run_cached_phase(self._test_accessibility),
+                _run_cached_phase(self._test_enterprise_features),
+            )
+        finally:
+            await context.close()
+            if owns_browser:
+                await browser.close()
+
+        self.generate_recommendations()
+        self.print_analysis_summary()
+        return self.results
+
+    async def _test_performance(self, page):
+        print("⚡ Testing performance...")
+
+        await page.goto(f"{self.base_url}/dashboard")
+        await page.wait_for_load_state("load")
+
+        # Read the browser's own Navigation Timing numbers rather than
+        # wall-clocking goto from Python, which folded driver RPC latency
+        # into the measurement. Waiting for "load" (not networkidle) is
+        # enough for loadEventEnd to be populated.
+        timing = await page.evaluate(
+            """() => { const t = performance.timing; return {
+                dns: t.domainLookupEnd - t.domainLookupStart,
+                ttfb: t.responseStart - t.requestStart,
+                domContentLoaded: t.domContentLoadedEventEnd - t.navigationStart,
+                loadEvent: t.loadEventEnd - t.navigationStart,
+            }; }"""
+        )
+
+        self._cached_html = await page.content()
+
+        self.results["performance"] = {
+            "dns_ms": timing["dns"],
+            "ttfb_ms": timing["ttfb"],
+            "dom_content_loaded_ms": timing["domContentLoaded"],
+            "page_load_time": round(timing["loadEvent"] / 1000, 2),
+            "load_under_3s": timing["loadEvent"] < 3000,
+        }
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Performance results: %s", self.results["performance"])
+
+    async def _test_functionality(self, page):
+        print("🔧 Testing functionality...")
+
+        functionality_results = {}
+
+        # Core dashboard sections must all render. The page is already loaded,
+        # so one evaluate reports all of them in a single driver round-trip
+        # instead of four sequential wait_for_selector calls.
+        present = await page.evaluate(
+            "sels => sels.map(s => !!document.querySelector(s))",
+            [selector for selector, _ in self._key_elements],
+        )
+        for (_, key), found in zip(self._key_elements, present):
+            functionality_results[f"{key}_present"] = found
+
+        # Refresh button should exist and be clickable - one query_selector
+        # round-trip instead of a locator count() followed by click()
+        try:
+            refresh_button = await page.query_selector("button:has-text('Refresh Data')")
+            if refresh_button:
+                await refresh_button.click()
+                functionality_results["refresh_button_works"] = True
+            else:
+                functionality_results["refresh_button_works"] = False
+        except Exception:
+            functionality_results["refresh_button_works"] = False
+
+        self.results["functionality"] = functionality_results
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Functionality results: %s", functionality_results)
+
+    async def _test_ui_ux(self, context):
+        print("🎨 Testing UI/UX...")
+
+        # Responsive behaviour across desktop / laptop / tablet breakpoints.
+        # One page per viewport, sized before navigation so each breakpoint
+        # lays out exactly once during load - no relayout pass and no 500ms
+        # settle sleep per size - and the three loads overlap.
+        viewports = [
+            {"width": 1920, "height": 1080},
+            {"width": 1366, "height": 768},
+            {"width": 768, "height": 1024},
+        ]
+
+        async def _check_viewport(size):
+            page = await context.new_page()
+            await page.set_viewport_size(size)
+            await page.goto(f"{self.base_url}/dashboard")
+            await page.wait_for_load_state("domcontentloaded")
+            return await page.locator("header, .header").is_visible()
+
+        visible = await asyncio.gather(*(_check_viewport(size) for size in viewports))
+        ui_results = {
+            f"responsive_{size['width']}x{size['height']}": ok
+            for size, ok in zip(viewports, visible)
+        }
+
+        self.results["ui_ux"] = ui_results
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("UI/UX results: %s", ui_results)
+
+    async def _test_accessibility(self, page):
+        print("♿ Testing accessibility...")
+
+        # Both counts in one round-trip instead of two locator().count() RPCs
+        counts = await page.evaluate(
+            """sels => Object.fromEntries(Object.entries(sels).map(
+                   ([k, v]) => [k, document.querySelectorAll(v).length]))""",
+            {
+                "aria": "[aria-label], [role]",
+                "focusable": "button, a, input, select, textarea, [tabindex]",
+            },
+        )
+
+        self.results["accessibility"] = {
+            "aria_elements": counts["aria"],
+            "focusable_elements": counts["focusable"],
+            "keyboard_navigable": counts["focusable"] > 0,
+        }
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Accessibility results: %s", self.results["accessibility"])
+
+    async def _test_enterprise_features(self, page):
+        print("🏢 Testing enterprise features...")
+
+        enterprise_results = {}
+
+        # Business intelligence panels - one round-trip for all three
+        present = await page.evaluate(
+            "sels => sels.map(s => !!document.querySelector(s))",
+            [selector for selector, _ in self._bi_elements],
+        )
+        for (_, key), found in zip(self._bi_elements, present):
+            enterprise_results[f"{key}_panel"] = found
+
+        # Enterprise controls and live-data widgets - the five counts were
+        # five separate locator().count() RPCs; one evaluate does them all
+        counts = await page.evaluate(
+            """sels => Object.fromEntries(Object.entries(sels).map(
+                   ([k, v]) => [k, document.querySelectorAll(v).length]))""",
+            {
+                "auto_refresh_controls": "button.refresh, .auto-refresh",
+                "export_controls": "button.export-btn",
+                "financial_metrics": ".financial-impact .metric",
+                "ai_panels": ".ai-insight-card",
+                "device_cards": ".device-card",
+            },
+        )
+        for key, count in counts.items():
+            enterprise_results[key] = count > 0
+
+        self.results["enterprise_features"] = enterprise_results
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Enterprise feature results: %s", enterprise_results)
+
+    def generate_recommendations(self):
+        """Turn the raw check results into actionable recommendations"""
+        recommendations = []
+        append = recommendations.append
+
+        perf_data = self.results["performance"]
+        if perf_data and not perf_data.get("load_under_3s"):
+            append(
+                f"Improve page load time "
+                f"({perf_data.get('page_load_time')}s > 3s target)"
+            )
+
+        for check, passed in self.results["functionality"].items():
+            if not passed:
+                append(f"Fix failing functionality check '{check}'")
+
+        ent_data = self.results["enterprise_features"]
+        if ent_data:
+            if not ent_data.get("auto_refresh_controls"):
+                append("Add auto-refresh controls to the dashboard")
+            if not ent_data.get("export_controls"):
+                append("Add data export controls to the dashboard")
+            if not ent_data.get("ai_panels"):
+                append("AI insight panels missing or not rendering")
+
+        self.results["recommendations"] = recommendations
+
+    def print_analysis_summary(self):
+        # Build the whole summary and emit it in one write - fifteen-odd
+        # individual prints each pay a write+flush, which adds up under CI
+        # log collectors and network-tunneled stdout
+        lines = ["", "=" * 60, "📊 ENTERPRISE DASHBOARD ANALYSIS SUMMARY", "=" * 60]
+
+        perf_data = self.results["performance"]
+        if perf_data:
+            lines.append("\n⚡ Performance:")
+            lines.append(f"   Page load: {perf_data.get('page_load_time')}s")
+            lines.append(f"   Under 3s target: {'✅' if perf_data.get('load_under_3s') else '❌'}")
+
+        func_data = self.results["functionality"]
+        if func_data:
+            passed = sum(1 for v in func_data.values() if v)
+            lines.append(f"\n🔧 Functionality: {passed}/{len(func_data)} checks passed")
+
+        ui_data = self.results["ui_ux"]
+        if ui_data:
+            passed = sum(1 for v in ui_data.values() if v)
+            lines.append(f"🎨 UI/UX: {passed}/{len(ui_data)} viewports OK")
+
+        acc_data = self.results["accessibility"]
+        if acc_data:
+            lines.append(f"♿ Accessibility: {acc_data.get('aria_elements')} ARIA elements, "
+                         f"{acc_data.get('focusable_elements')} focusable")
+
+        ent_data = self.results["enterprise_features"]
+        if ent_data:
+            passed = sum(1 for v in ent_data.values() if v)
+            lines.append(f"🏢 Enterprise features: {passed}/{len(ent_data)} present")
+
+        recommendations = self.results.get("recommendations", [])
+        if recommendations:
+            lines.append(f"\n💡 Recommendations ({len(recommendations)}):")
+            lines.extend(f"   - {rec}" for rec in recommendations)
+        else:
+            lines.append("\n🎉 No recommendations - dashboard looks enterprise-ready!")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def main():
+    try:
+        tester = EnterpriseDashboardTester()
+        results = await tester.run_full_analysis()
+
+        with open("enterprise_dashboard_analysis.json", "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        print("\n💾 Full analysis saved to enterprise_dashboard_analysis.json")
+    finally:
+        await stop_playwright()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+🏁 FINAL ENTERPRISE DASHBOARD VERIFICATION
+Quick Playwright smoke test of the deployed dashboard before sign-off
+"""
+
+import asyncio
+import os
+from datetime import datetime
+
+import orjson
+
+# Same browser-cache pinning as the full suite, for standalone runs
+os.environ.setdefault("PLAYWRIGHT_BROWSERS_PATH", os.path.expanduser("~/.cache/ms-playwright"))
+
+from test_enterprise_dashboard import (
+    LAUNCH_ARGS,
+    block_heavy_resources,
+    get_playwright,
+    stop_playwright,
+)
+
+BASE_URL = "https://jd-engineering-monitoring-api-production-5d93.up.railway.app"
+
+
+class FinalTester:
+    """Single-pass verification that the dashboard renders its key widgets"""
+
+    def __init__(self, base_url=BASE_URL):
+        self.base_url = base_url
+
+    async def run_final_test(self, browser=None):
+        print("🏁 Running final dashboard verification...")
+        print("=" * 50)
+
+        results = {"timestamp": datetime.now().isoformat(), "checks": {}}
+
+        # An injected browser (see runner.py) is reused and left open so the
+        # combined run only launches Chromium once
+        owns_browser = browser is None
+        if owns_browser:
+            p = await get_playwright()
+            browser = await p.chromium.launch(
+                headless=not os.environ.get("HEADED"),
+                args=LAUNCH_ARGS,
+            )
+        context = await browser.new_context()
+        await context.route("**/*", block_heavy_resources)
+        page = await context.new_page()
+
+        await page.goto(f"{self.base_url}/dashboard")
+        # DOM presence is all this smoke test checks - no need to wait for
+        # the network to go quiet (which a polling dashboard may never do)
+        await page.wait_for_load_state("domcontentloaded")
+
+        # Every check fused into one DOM probe - sections, card count,
+        # buttons and the totals text used to be eight-plus sequential
+        # driver round-trips
+        sections = [".business-overview", ".device-grid", ".financial-impact", ".ai-insights"]
+        probe = await page.evaluate(
+            """sels => ({
+                sections: Object.fromEntries(
+                    sels.map(s => [s, !!document.querySelector(s)])),
+                deviceCount: document.querySelectorAll('.device-card').length,
+                refresh: !!document.querySelector('#refreshBtn'),
+                export: !!document.querySelector('#exportBtn'),
+                total: (document.querySelector('#totalDevices') || {}).textContent ?? null,
+            })""",
+            sections,
+        )
+
+        for section, found in probe["sections"].items():
+            key = section.replace('.', '').replace('#', '')
+            results["checks"][key] = found
+            print(f"{'✅' if found else '❌'} {key} {'present' if found else 'missing'}")
+
+        results["checks"]["device_cards"] = probe["deviceCount"]
+        print(f"📱 Device cards rendered: {probe['deviceCount']}")
+
+        results["checks"]["refresh_button"] = probe["refresh"]
+        results["checks"]["export_button"] = probe["export"]
+        results["checks"]["total_devices_text"] = probe["total"]
+
+        await context.close()
+        if owns_browser:
+            await browser.close()
+
+        passed = sum(1 for v in results["checks"].values() if v)
+        print(f"\n📊 Final verification: {passed}/{len(results['checks'])} checks OK")
+        return results
+
+
+async def main():
+    tester = FinalTester()
+    results = await tester.run_final_test()
+
+    with open("final_dashboard_test.json", "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    print("💾 Results saved to final_dashboard_test.json")
+
+
+async def _standalone():
+    # Only tear the shared driver down when this suite runs on its own; the
+    # combined run in test_enterprise_dashboard owns the driver lifecycle
+    try:
+        await main()
+    finally:
+        await stop_playwright()
+
+
+if __name__ == "__main__":
+    asyncio.run(_standalone())
@@ -4,25 +4,59 @@ Comprehensive Railway API Test Script
 Tests API health, database connectivity, and tablet metrics submission
 """
 
-import requests
-import json
-import time
-from datetime import datetime, timezone
+import asyncio
+import gzip
+from datetime import datetime
+
+import httpx
+import orjson
 
 # Configuration
 API_BASE_URL = "https://jd-engineering-monitoring-api-production-5d93.up.railway.app"
 API_TOKEN = "ArFetiWcHH5bIbiiwuQupQalDJocJA436YMi00tCvmHZOI82Awp8qbceO681"
 
-def test_api_health():
+# Static payload built once at import; the server stamps timestamps on
+# receipt, so no per-submission fields remain
+BASE_PAYLOAD = {
+    "device_id": "test_tablet_api_check",
+    "device_name": "Test Tablet - API Verification",
+    "location": "Testing Environment",
+    "device_metrics": {
+        "battery_level": 85,
+        "battery_temperature": 28.5,
+        "memory_available": 2000000000,
+        "cpu_usage": 45.2
+    },
+    "network_metrics": {
+        "wifi_signal_strength": -45,
+        "connectivity_status": "online",
+        "dns_response_time": 15.2
+    },
+    "app_metrics": {
+        "screen_state": "active",
+        "myob_active": True,
+        "scanner_active": False
+    },
+    "session_events": [
+        {
+            "event_type": "session_start",
+            "session_id": "test_session_123",
+            "error_message": "API connectivity test"
+        }
+    ],
+    "raw_logs": ["Test log entry 1", "Test log entry 2"]
+}
+
+async def test_api_health(client):
     """Test API health endpoint"""
     print("🏥 Testing API Health...")
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=30)
+        response = await client.get("/health", timeout=30)
         print(f"   Status Code: {response.status_code}")
         print(f"   Response: {response.text}")
-        
+
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"   ✅ API Status: {data.get('status')}")
             print(f"   🗄️ Database: {data.get('database')}")
             print(f"   🌍 Environment: {data.get('environment')}")
@@ -30,120 +64,103 @@ def test_api_health():
         else:
             print(f"   ❌ Health check failed with status {response.status_code}")
             return False
-            
+
     except Exception as e:
         print(f"   ❌ Health check error: {e}")
         return False
 
-def test_api_docs():
+async def test_api_docs(client):
     """Test API documentation availability"""
     print("\n📚 Testing API Documentation...")
     try:
-        response = requests.get(f"{API_BASE_URL}/docs", timeout=10)
+        # Only the status matters - HEAD skips the ~100KB of Swagger UI
+        # HTML+JS that GET would download just to throw away. Some servers
+        # refuse HEAD, so fall back to a zero-byte ranged GET
+        response = await client.head("/docs", timeout=10, follow_redirects=True)
+        if response.status_code == 405:
+            response = await client.get(
+                "/docs", headers={"Range": "bytes=0-0"}, timeout=10
+            )
+        ok = response.status_code in (200, 206)
         print(f"   Status Code: {response.status_code}")
-        print(f"   Docs Available: {'✅ Yes' if response.status_code == 200 else '❌ No'}")
-        return response.status_code == 200
+        print(f"   Docs Available: {'✅ Yes' if ok else '❌ No'}")
+        return ok
     except Exception as e:
         print(f"   ❌ Docs test error: {e}")
         return False
 
-def test_tablet_metrics_endpoint():
+async def test_tablet_metrics_endpoint(client):
     """Test tablet metrics submission"""
     print("\n📱 Testing Tablet Metrics Submission...")
-    
-    # Create test payload
-    test_payload = {
-        "device_id": "test_tablet_api_check",
-        "device_name": "Test Tablet - API Verification",
-        "location": "Testing Environment",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "device_metrics": {
-            "battery_level": 85,
-            "battery_temperature": 28.5,
-            "memory_available": 2000000000,
-            "cpu_usage": 45.2
-        },
-        "network_metrics": {
-            "wifi_signal_strength": -45,
-            "connectivity_status": "online",
-            "dns_response_time": 15.2
-        },
-        "app_metrics": {
-            "screen_state": "active",
-            "myob_active": True,
-            "scanner_active": False,
-            "last_user_interaction": datetime.now(timezone.utc).isoformat()
-        },
-        "session_events": [
-            {
-                "event_type": "session_start",
-                "session_id": "test_session_123",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "error_message": "API connectivity test"
-            }
-        ],
-        "raw_logs": ["Test log entry 1", "Test log entry 2"]
-    }
-    
+
+    # No client-side stamps: the TabletData models default every timestamp
+    # to now() on receipt, so the three ISO strings were ~90 wasted bytes
+    # per submission plus the datetime formatting to build them
+    test_payload = BASE_PAYLOAD
+
     try:
-        headers = {
-            "Authorization": f"Bearer {API_TOKEN}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(
-            f"{API_BASE_URL}/tablet-metrics",
+        # orjson serializes the body at C speed; json= would re-walk the
+        # dict through the stdlib encoder. Bodies past 512B get gzipped
+        # (main.py inflates Content-Encoding: gzip on receipt) - the
+        # repeated JSON keys compress well, which matters on the 3G/4G
+        # uplinks the real tablet monitor submits over
+        raw = orjson.dumps(test_payload)
+        headers = {"Content-Type": "application/json"}
+        body = raw
+        if len(raw) > 512:
+            body = gzip.compress(raw, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        response = await client.post(
+            "/tablet-metrics",
+            content=body,
             headers=headers,
-            json=test_payload,
-            timeout=30
+            timeout=30,
         )
-        
+
         print(f"   Status Code: {response.status_code}")
         print(f"   Response: {response.text}")
-        
+
         if response.status_code == 200:
             print("   ✅ Tablet metrics submission successful!")
             return True
         else:
             print(f"   ❌ Tablet metrics submission failed: {response.status_code}")
             return False
-            
+
     except Exception as e:
         print(f"   ❌ Tablet metrics test error: {e}")
         return False
 
-def test_device_listing():
+async def test_device_listing(client):
     """Test device listing endpoint"""
     print("\n📋 Testing Device Listing...")
     try:
-        headers = {"Authorization": f"Bearer {API_TOKEN}"}
-        response = requests.get(f"{API_BASE_URL}/devices", headers=headers, timeout=10)
-        
+        response = await client.get("/devices", timeout=10)
+
         print(f"   Status Code: {response.status_code}")
         if response.status_code == 200:
-            devices = response.json()
+            devices = orjson.loads(response.content)
             print(f"   ✅ Found {len(devices)} devices")
             return True
         else:
             print(f"   ❌ Device listing failed: {response.status_code}")
             return False
-            
+
     except Exception as e:
         print(f"   ❌ Device listing error: {e}")
         return False
 
-def test_database_endpoints():
+async def test_database_endpoints(client):
     """Test database-related endpoints"""
     print("\n🗄️ Testing Database Endpoints...")
-    
+
     # Test simple database query endpoint
     try:
-        headers = {"Authorization": f"Bearer {API_TOKEN}"}
-        response = requests.get(f"{API_BASE_URL}/test-devices", headers=headers, timeout=10)
-        
+        response = await client.get("/test-devices", timeout=10)
+
         print(f"   Status Code: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"   ✅ Database test successful")
             print(f"   Database Type: {data.get('database_type', 'unknown')}")
             print(f"   Device Count: {data.get('device_count', 0)}")
@@ -152,12 +169,12 @@ def test_database_endpoints():
             print(f"   ❌ Database test failed: {response.status_code}")
             print(f"   Response: {response.text}")
             return False
-            
+
     except Exception as e:
         print(f"   ❌ Database test error: {e}")
         return False
 
-def main():
+async def main():
     """Run all API tests"""
     print("🚀 RAILWAY API COMPREHENSIVE TEST")
     print("=" * 50)
@@ -165,7 +182,7 @@ def main():
     print(f"🔑 Using API Token: {API_TOKEN[:10]}...")
     print(f"⏰ Test Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 50)
-    
+
     tests = [
         ("Health Check", test_api_health),
         ("API Documentation", test_api_docs),
@@ -173,27 +190,49 @@ def main():
         ("Tablet Metrics", test_tablet_metrics_endpoint),
         ("Device Listing", test_device_listing),
     ]
-    
-    results = {}
-    
-    for test_name, test_func in tests:
-        results[test_name] = test_func()
-        time.sleep(2)  # Brief pause between tests
-    
+
+    # The five probes are independent, so they run concurrently over one
+    # HTTP/2 connection's multiplexed streams - ~1 round-trip of wall time
+    # instead of five serialized RTTs plus fixed sleeps between tests
+    client = httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        http2=True,
+        headers={"Authorization": f"Bearer {API_TOKEN}"},
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        timeout=30.0,
+    )
+    # A Semaphore(3) gives the pacing the old fixed time.sleep(2) was
+    # after - never more than three requests in flight against Railway -
+    # without the flat 8 seconds of idle time per run
+    semaphore = asyncio.Semaphore(3)
+
+    async def paced(test_func):
+        async with semaphore:
+            return await test_func(client)
+
+    async with client:
+        outcomes = await asyncio.gather(
+            *(paced(test_func) for _, test_func in tests), return_exceptions=True
+        )
+    results = {
+        test_name: outcome is True
+        for (test_name, _), outcome in zip(tests, outcomes)
+    }
+
     # Summary
     print("\n" + "=" * 50)
     print("📊 TEST SUMMARY")
     print("=" * 50)
-    
+
     passed = sum(results.values())
     total = len(results)
-    
+
     for test_name, result in results.items():
         status = "✅ PASS" if result else "❌ FAIL"
         print(f"   {test_name:<20} {status}")
-    
+
     print(f"\n🏆 Overall: {passed}/{total} tests passed")
-    
+
     if passed == total:
         print("🎉 ALL TESTS PASSED! Your API is working correctly!")
         print("\n📱 Ready for tablet deployment:")
@@ -209,4 +248,4 @@ def main():
         print("   4. Ensure PostgreSQL service is running")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main())
@@ -4,104 +4,136 @@ DETAILED REAL DATA VERIFICATION TEST
 Comprehensive verification that ALL real device data is visible and AI is working
 """
 
-import requests
-import json
+import asyncio
+import sys
 import time
 from datetime import datetime
 
+import ahocorasick
+import httpx
+import numpy as np
+import orjson
+import pandas as pd
+
 # Configuration
 API_BASE = "https://jd-engineering-monitoring-api-production.up.railway.app"
 API_TOKEN = "ArFetiWcHH5bIbiiwuQupQalDJocJA436YMi00tCvmHZOI82Awp8qbceO681"
-HEADERS = {"Authorization": f"Bearer {API_TOKEN}"}
 
-def detailed_device_analysis():
+# 30s TTL cache keyed by path: CI loops re-run this suite within seconds,
+# and skipping a 100-300ms round trip entirely beats any client tuning.
+# GETs only - never cache a POST
+_CACHE = {}
+
+async def cached_get(client, path, ttl=30, timeout=10):
+    now = time.monotonic()
+    hit = _CACHE.get(path)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    response = await client.get(path, timeout=timeout)
+    _CACHE[path] = (now, response)
+    return response
+
+async def detailed_device_analysis(client):
     """Analyze each device in detail"""
     print("\n🔍 DETAILED DEVICE ANALYSIS")
     print("=" * 50)
     
     try:
-        response = requests.get(f"{API_BASE}/devices", headers=HEADERS, timeout=10)
+        response = await cached_get(client, "/devices")
         if response.status_code == 200:
-            devices = response.json()
+            devices = orjson.loads(response.content)
             print(f"✅ Found {len(devices)} real devices")
             
+            # Vectorized health scoring: the penalty arithmetic runs as a
+            # handful of NumPy column ops instead of Python branches per
+            # device, which matters once the fleet grows past a handful
+            df = pd.DataFrame(devices)
+            for col, default in (("battery_level", 0), ("status", "offline"),
+                                 ("timeout_risk", False), ("seconds_since_last_seen", 0)):
+                if col not in df:
+                    df[col] = default
+            battery = df["battery_level"].fillna(0)
+            offline = df["status"] != "online"
+            at_risk = df["timeout_risk"].fillna(False).astype(bool)
+            stale = df["seconds_since_last_seen"].fillna(0) > 300
+            health_scores = (
+                100
+                - np.where(battery < 20, 30, np.where(battery < 50, 15, 0))
+                - np.where(offline, 40, 0)
+                - np.where(at_risk, 25, 0)
+            )
+            low_battery = battery < 25
+            
+            # Each device's ~20 report lines build in a list and land in
+            # one buffered write at the end - one syscall for the whole
+            # fleet instead of 20+ per device through line-buffered stdout
+            out = []
             for i, device in enumerate(devices, 1):
-                print(f"\n📱 DEVICE {i}: {device['device_id']}")
-                print("-" * 40)
-                print(f"   Name: {device.get('device_name', 'N/A')}")
-                print(f"   Location: {device.get('location', 'N/A')}")
-                print(f"   Status: {device.get('status', 'N/A')}")
-                print(f"   Battery: {device.get('battery_level', 'N/A')}%")
-                print(f"   Battery Temp: {device.get('battery_temperature', 'N/A')}°C")
-                print(f"   WiFi Signal: {device.get('wifi_signal_strength', 'N/A')} dBm")
-                print(f"   WiFi SSID: {device.get('wifi_ssid', 'N/A')}")
-                print(f"   Connectivity: {device.get('connectivity_status', 'N/A')}")
-                print(f"   Screen State: {device.get('screen_state', 'N/A')}")
-                print(f"   App Foreground: {device.get('app_foreground', 'N/A')}")
-                print(f"   MYOB Active: {device.get('myob_active', 'N/A')}")
-                print(f"   Scanner Active: {device.get('scanner_active', 'N/A')}")
-                print(f"   Timeout Risk: {device.get('timeout_risk', 'N/A')}")
-                print(f"   Last Seen: {device.get('last_seen', 'N/A')}")
-                print(f"   Seconds Since Last Seen: {device.get('seconds_since_last_seen', 'N/A')}")
-                print(f"   Total Sessions: {device.get('total_sessions', 'N/A')}")
-                print(f"   Total Timeouts: {device.get('total_timeouts', 'N/A')}")
-                
-                # Analyze device health
-                battery = device.get('battery_level', 0)
-                is_online = device.get('status') == 'online'
-                has_timeout_risk = device.get('timeout_risk', False)
-                
-                health_score = 100
-                if battery < 20:
-                    health_score -= 30
-                elif battery < 50:
-                    health_score -= 15
-                
-                if not is_online:
-                    health_score -= 40
-                
-                if has_timeout_risk:
-                    health_score -= 25
+                out.append(f"\n📱 DEVICE {i}: {device['device_id']}")
+                out.append("-" * 40)
+                out.append(f"   Name: {device.get('device_name', 'N/A')}")
+                out.append(f"   Location: {device.get('location', 'N/A')}")
+                out.append(f"   Status: {device.get('status', 'N/A')}")
+                out.append(f"   Battery: {device.get('battery_level', 'N/A')}%")
+                out.append(f"   Battery Temp: {device.get('battery_temperature', 'N/A')}°C")
+                out.append(f"   WiFi Signal: {device.get('wifi_signal_strength', 'N/A')} dBm")
+                out.append(f"   WiFi SSID: {device.get('wifi_ssid', 'N/A')}")
+                out.append(f"   Connectivity: {device.get('connectivity_status', 'N/A')}")
+                out.append(f"   Screen State: {device.get('screen_state', 'N/A')}")
+                out.append(f"   App Foreground: {device.get('app_foreground', 'N/A')}")
+                out.append(f"   MYOB Active: {device.get('myob_active', 'N/A')}")
+                out.append(f"   Scanner Active: {device.get('scanner_active', 'N/A')}")
+                out.append(f"   Timeout Risk: {device.get('timeout_risk', 'N/A')}")
+                out.append(f"   Last Seen: {device.get('last_seen', 'N/A')}")
+                out.append(f"   Seconds Since Last Seen: {device.get('seconds_since_last_seen', 'N/A')}")
+                out.append(f"   Total Sessions: {device.get('total_sessions', 'N/A')}")
+                out.append(f"   Total Timeouts: {device.get('total_timeouts', 'N/A')}")
                 
+                # Health score and issue flags come from the vectorized
+                # columns computed above
+                row = i - 1
+                health_score = int(health_scores[row])
                 health_status = "EXCELLENT" if health_score >= 90 else \
                                "GOOD" if health_score >= 70 else \
                                "FAIR" if health_score >= 50 else "POOR"
                 
-                print(f"   🏥 HEALTH SCORE: {health_score}/100 ({health_status})")
+                out.append(f"   🏥 HEALTH SCORE: {health_score}/100 ({health_status})")
                 
-                # Check for specific issues
                 issues = []
-                if battery < 25:
+                if low_battery.iat[row]:
                     issues.append("🔋 LOW BATTERY")
-                if not is_online:
+                if offline.iat[row]:
                     issues.append("📡 OFFLINE")
-                if has_timeout_risk:
+                if at_risk.iat[row]:
                     issues.append("⏰ TIMEOUT RISK")
-                if device.get('seconds_since_last_seen', 0) > 300:
+                if stale.iat[row]:
                     issues.append("📶 STALE DATA")
                 
                 if issues:
-                    print(f"   ⚠️ ISSUES: {', '.join(issues)}")
+                    out.append(f"   ⚠️ ISSUES: {', '.join(issues)}")
                 else:
-                    print(f"   ✅ NO ISSUES DETECTED")
+                    out.append("   ✅ NO ISSUES DETECTED")
+            
+            if out:
+                sys.stdout.write("\n".join(out) + "\n")
             
-            return devices
+            return devices, response.status_code
         else:
             print(f"❌ Failed to get devices: {response.status_code}")
-            return []
+            return [], response.status_code
     except Exception as e:
         print(f"❌ Device analysis error: {str(e)}")
-        return []
+        return [], 0
 
-def test_analytics_data():
+async def test_analytics_data(client):
     """Test analytics data in detail"""
     print("\n📊 ANALYTICS DATA VERIFICATION")
     print("=" * 50)
     
     try:
-        response = requests.get(f"{API_BASE}/analytics", headers=HEADERS, timeout=10)
+        response = await cached_get(client, "/analytics")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print("✅ Analytics data retrieved successfully")
             print(f"   📱 Total Devices: {data.get('total_devices', 'N/A')}")
             print(f"   🟢 Online Devices: {data.get('online_devices', 'N/A')}")
@@ -138,15 +170,15 @@ def test_analytics_data():
         print(f"❌ Analytics test error: {str(e)}")
         return {}
 
-def test_ai_comprehensive_analysis():
+async def test_ai_comprehensive_analysis(client):
     """Test AI analysis in detail"""
     print("\n🤖 AI COMPREHENSIVE ANALYSIS TEST")
     print("=" * 50)
     
     try:
-        response = requests.get(f"{API_BASE}/analytics/ai/comprehensive-analysis", headers=HEADERS, timeout=15)
+        response = await client.get("/analytics/ai/comprehensive-analysis", timeout=15)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print("✅ AI analysis retrieved successfully")
             
             # Check data points analyzed
@@ -199,52 +231,101 @@ def test_ai_comprehensive_analysis():
         print(f"❌ AI analysis test error: {str(e)}")
         return {}
 
-def test_dashboard_accessibility():
+# Dashboard content markers - AI enhancements and data integration hooks.
+# Compiled once into an Aho-Corasick automaton so one linear pass over the
+# page finds every marker, instead of 12 independent substring scans
+AI_ELEMENTS = [
+    "AI-Powered Business Intelligence",
+    "OpenAI GPT-3.5 Enhanced",
+    "ai-status-panel",
+    "ai-executive-panel",
+    "comprehensive-analysis",
+    "loadBusinessIntelligence",
+    "updateAIExecutiveSummary"
+]
+
+DATA_ELEMENTS = [
+    "API_BASE",
+    "API_TOKEN",
+    "/analytics",
+    "/devices",
+    "loadAllData"
+]
+
+_MARKER_AUTOMATON = ahocorasick.Automaton()
+for _marker in AI_ELEMENTS + DATA_ELEMENTS:
+    _MARKER_AUTOMATON.add_word(_marker, _marker)
+_MARKER_AUTOMATON.make_automaton()
+
+# Prefer Google's RE2 when available: the escaped alternation runs as a
+# linear-time DFA with no backtracking, and pyre2 releases the GIL during
+# the scan. The automaton above stays as the fallback
+try:
+    import re2
+
+    _MARKER_RE2 = re2.compile("|".join(re2.escape(m) for m in AI_ELEMENTS + DATA_ELEMENTS))
+except ImportError:
+    _MARKER_RE2 = None
+
+# Conditional-request cache: the ETag from the previous run rides back as
+# If-None-Match, and an unchanged dashboard answers 304 with zero body
+_DASHBOARD_CACHE_FILE = ".dashboard_cache.json"
+
+def _load_dashboard_cache():
+    try:
+        with open(_DASHBOARD_CACHE_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+async def test_dashboard_accessibility(client):
     """Test dashboard accessibility and content"""
     print("\n🌐 DASHBOARD ACCESSIBILITY TEST")
     print("=" * 50)
     
     try:
-        response = requests.get(f"{API_BASE}/dashboard", timeout=10)
+        cached = _load_dashboard_cache()
+        conditional = {}
+        if cached and cached.get("etag"):
+            conditional["If-None-Match"] = cached["etag"]
+        elif cached and cached.get("last_modified"):
+            conditional["If-Modified-Since"] = cached["last_modified"]
+        
+        response = await client.get("/dashboard", timeout=10, headers=conditional)
+        if response.status_code == 304 and cached:
+            print("✅ Dashboard unchanged (304) - using cached scan result")
+            print(f"   🤖 AI Elements Found: {cached['ai_found']}/{len(AI_ELEMENTS)}")
+            print(f"   📊 Data Integration: {cached['data_found']}/{len(DATA_ELEMENTS)} elements")
+            return True
         if response.status_code == 200:
             content = response.text
             print(f"✅ Dashboard accessible (Size: {len(content):,} bytes)")
             
-            # Check for AI enhancements
-            ai_elements = [
-                "AI-Powered Business Intelligence",
-                "OpenAI GPT-3.5 Enhanced",
-                "ai-status-panel",
-                "ai-executive-panel",
-                "comprehensive-analysis",
-                "loadBusinessIntelligence",
-                "updateAIExecutiveSummary"
-            ]
-            
-            found_elements = []
-            for element in ai_elements:
-                if element in content:
-                    found_elements.append(element)
+            # One linear pass locates every marker at once
+            if _MARKER_RE2 is not None:
+                found = set(_MARKER_RE2.findall(content))
+            else:
+                found = {marker for _, marker in _MARKER_AUTOMATON.iter(content)}
             
-            print(f"   🤖 AI Elements Found: {len(found_elements)}/{len(ai_elements)}")
+            found_elements = [elem for elem in AI_ELEMENTS if elem in found]
+            print(f"   🤖 AI Elements Found: {len(found_elements)}/{len(AI_ELEMENTS)}")
             
-            if len(found_elements) == len(ai_elements):
+            if len(found_elements) == len(AI_ELEMENTS):
                 print("   ✅ All AI enhancements present")
             else:
-                missing = [elem for elem in ai_elements if elem not in found_elements]
+                missing = [elem for elem in AI_ELEMENTS if elem not in found]
                 print(f"   ⚠️ Missing elements: {missing}")
             
-            # Check for data integration
-            data_elements = [
-                "API_BASE",
-                "API_TOKEN",
-                "/analytics",
-                "/devices",
-                "loadAllData"
-            ]
+            data_found = [elem for elem in DATA_ELEMENTS if elem in found]
+            print(f"   📊 Data Integration: {len(data_found)}/{len(DATA_ELEMENTS)} elements")
             
-            data_found = [elem for elem in data_elements if elem in content]
-            print(f"   📊 Data Integration: {len(data_found)}/{len(data_elements)} elements")
+            with open(_DASHBOARD_CACHE_FILE, "wb") as f:
+                f.write(orjson.dumps({
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "ai_found": len(found_elements),
+                    "data_found": len(data_found),
+                }))
             
             return True
         else:
@@ -254,24 +335,41 @@ def test_dashboard_accessibility():
         print(f"❌ Dashboard test error: {str(e)}")
         return False
 
-def main():
+async def main():
     """Run comprehensive real data verification"""
     print("🚀 COMPREHENSIVE REAL DATA VERIFICATION")
     print("=" * 60)
     print(f"🎯 Target: {API_BASE}")
     print(f"🕒 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Test 1: Device Analysis
-    devices = detailed_device_analysis()
-    
-    # Test 2: Analytics Data
-    analytics = test_analytics_data()
-    
-    # Test 3: AI Analysis
-    ai_analysis = test_ai_comprehensive_analysis()
-    
-    # Test 4: Dashboard
-    dashboard_ok = test_dashboard_accessibility()
+    # The four endpoints are independent reads, so they run concurrently -
+    # one round trip of wall time instead of four, which matters most for
+    # the AI endpoint and its 15s budget
+    # Advertise Brotli alongside gzip: the brotli package auto-decompresses
+    # and br typically shaves another ~20-25% off the dashboard HTML
+    client = httpx.AsyncClient(
+        base_url=API_BASE,
+        http2=True,
+        headers={
+            "Authorization": f"Bearer {API_TOKEN}",
+            "Accept-Encoding": "gzip, br",
+        },
+        timeout=15.0,
+    )
+    async with client:
+        # The device probe goes first as a cheap liveness gate: when it
+        # comes back empty because the API is down or auth is broken,
+        # skipping the other tests saves three rounds of timeouts against
+        # an already-dead service
+        devices, http_status = await detailed_device_analysis(client)
+        if not devices and http_status in (0, 401, 403, 502, 503, 504):
+            print(f"\n❌ Aborting remaining tests - API unreachable (status {http_status})")
+            return
+        analytics, ai_analysis, dashboard_ok = await asyncio.gather(
+            test_analytics_data(client),
+            test_ai_comprehensive_analysis(client),
+            test_dashboard_accessibility(client),
+        )
     
     # Summary
     print("\n" + "=" * 60)
@@ -320,4 +418,4 @@ def main():
     print(f"📅 Test Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main())